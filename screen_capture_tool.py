@@ -15,26 +15,39 @@ https://github.com/Unicorn8521/screen-capture-tool
 本程序免费开源，欢迎使用和改进。
 """
 
+import collections
+import copy
+import ctypes
 import datetime
+import functools
+import hashlib
+import io
 import json
 import os
+import queue
+import shutil
+import struct
 import sys
+import threading
 import time
 import tkinter as tk
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import font as tkfont
 from tkinter import ttk, filedialog, messagebox, simpledialog, scrolledtext
 
 import keyboard
-from PIL import Image, ImageTk, ImageGrab, ImageOps, ImageDraw, ImageFont
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Image as RLImage, Spacer
+from PIL import Image, ImageTk, ImageGrab, ImageOps, ImageDraw, ImageFont, features
+
+try:
+    import orjson  # 可选依赖，安装后会话文件读写更快
+except ImportError:
+    orjson = None
+
+try:
+    import mss  # 可选依赖，安装后截图更快
+except ImportError:
+    mss = None
 
 
 # 常量定义 - 集中管理配置参数
@@ -46,9 +59,41 @@ class Config:
     DEFAULT_HOTKEY = "ctrl+alt+o"
     SESSIONS_DIR = os.path.join(os.path.expanduser("~"), ".screen_capture_sessions")
     CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".screen_capture_config.json")
+    INDEX_FILENAME = "index.json"  # 会话目录中的历史记录索引文件
+    SESSION_REQUIRED_KEYS = ("id", "name", "start_time", "duration", "captures")  # 会话文件必须包含的字段
+    SESSION_SUMMARY_KEYS = ("id", "name", "start_time", "duration", "captures_count", "mtime_ns")  # 索引中每个会话摘要必须包含的字段
+    MAX_LISTED_ERRORS = 20  # 汇总提示中最多列出的错误条数
     FONT_FAMILIES = ["SimHei", "WenQuanYi Micro Hei", "Heiti TC", "Arial Unicode MS", "Microsoft YaHei", "Arial",
                      "sans-serif"]
     TEMP_TIP_DURATION = 2000  # 临时提示显示时间(ms)
+    HOTKEY_POLL_INTERVAL = 0.005  # Windows下轮询快捷键状态的间隔(s)
+    UI_QUEUE_INTERVAL = 30  # 界面线程处理后台线程投递操作的间隔(ms)
+    CAPTURE_DEBOUNCE = 0.25  # 上次截图结束后的最小间隔(s)，间隔内的按键被忽略
+    # 快捷键修饰键对应的Windows虚拟键码
+    MODIFIER_VK_CODES = {"ctrl": 0x11, "alt": 0x12, "shift": 0x10}
+    WEBP_SUPPORTED = features.check("webp")  # 当前Pillow是否支持WebP，不支持时截图回退为PNG、缩略图回退为JPEG
+    DEFAULT_IMAGE_FORMAT = "webp" if WEBP_SUPPORTED else "png"  # 截图存储格式，可在配置文件中通过image_format修改
+    # 各存储格式的保存参数（扩展名 -> Pillow参数），均选择编码最快的设置
+    IMAGE_SAVE_OPTIONS = {
+        **({"webp": {"format": "WEBP", "lossless": True, "quality": 0, "method": 0}} if WEBP_SUPPORTED else {}),
+        "png": {"format": "PNG", "compress_level": 1},
+        "jpg": {"format": "JPEG", "quality": 85, "optimize": True, "progressive": True},
+    }
+    THUMBNAIL_SIZE = 1600  # 报告用缩略图的最大边长(px)，截图不超过此尺寸时不生成缩略图
+    THUMBNAIL_QUALITY = 80  # 缩略图压缩质量
+    THUMBNAIL_FORMAT = ("webp", "WEBP") if WEBP_SUPPORTED else ("jpg", "JPEG")  # 缩略图 (扩展名, Pillow格式)
+    LOAD_WORKERS = 8  # 并发加载历史会话的线程数
+    HISTORY_PAGE_SIZE = 50  # 历史列表每次渲染的行数，滚动到底部时再加载下一页
+    COPY_WORKERS = 8  # 生成Markdown报告时并发复制图片的线程数
+    MD_WRITE_BUFFER = 1 << 20  # 写入Markdown报告的缓冲区大小(字节)
+    REPORT_POLL_INTERVAL = 100  # 后台生成报告时检查完成状态的间隔(ms)
+    PDF_IMAGE_WIDTH = 400  # PDF报告中截图的最大显示宽度(pt)
+    PDF_JPEG_QUALITY = 85  # PDF报告中截图的JPEG压缩质量
+    PDF_IMAGE_CACHE_SIZE = 256  # 缓存的PDF截图编码结果数量，重复生成报告时复用
+    DOCX_IMAGE_SIZE = 900  # Word报告中截图的最大边长(px)，按6英寸显示宽度取约150dpi
+    DOCX_JPEG_QUALITY = 82  # Word报告中截图的JPEG压缩质量
+    REPORT_IMAGE_WORKERS = os.cpu_count() or 4  # 生成报告时并发缩放编码截图的线程数
+    PREVIEW_CACHE_BYTES = 64 * 1024 * 1024  # 编辑窗口预览图缓存的内存上限(字节)，4K截图约每张25MB
     REPORT_FORMATS = {
         "docx": {"desc": "兼容性好，支持编辑", "title": "Word 文档 (.docx)"},
         "pdf": {"desc": "格式固定，跨平台", "title": "PDF 文档 (.pdf)"},
@@ -59,6 +104,7 @@ class Config:
 # 工具类 - 封装通用功能
 class Utils:
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def format_duration(seconds):
         """格式化时长为易读字符串"""
         minutes, seconds = divmod(seconds, 60)
@@ -71,14 +117,30 @@ class Utils:
             return f"{seconds}s"
 
     @staticmethod
-    def get_timestamp():
-        """获取当前时间戳字符串"""
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def get_timestamp(now=None):
+        """获取时间戳字符串，默认为当前时间"""
+        return (now or datetime.datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
 
     @staticmethod
-    def get_file_timestamp():
-        """获取用于文件名的时间戳"""
-        return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    def get_file_timestamp(now=None):
+        """获取用于文件名的时间戳，默认为当前时间"""
+        return (now or datetime.datetime.now()).strftime("%Y%m%d_%H%M%S")
+
+    @staticmethod
+    def hotkey_to_vk_codes(hotkey):
+        """将快捷键字符串转换为Windows虚拟键码列表，无法转换时返回None"""
+        vk_codes = []
+        for part in hotkey.lower().split('+'):
+            part = part.strip()
+            if part in Config.MODIFIER_VK_CODES:
+                vk_codes.append(Config.MODIFIER_VK_CODES[part])
+            elif len(part) == 1 and part.isalnum() and part.isascii():
+                vk_codes.append(ord(part.upper()))
+            elif part.startswith('f') and part[1:].isdigit() and 1 <= int(part[1:]) <= 24:
+                vk_codes.append(0x70 + int(part[1:]) - 1)
+            else:
+                return None
+        return vk_codes or None
 
     @staticmethod
     def ensure_dir(path):
@@ -100,6 +162,136 @@ class Utils:
         except ValueError:
             return target_path  # 跨盘符时返回绝对路径
 
+    @staticmethod
+    def atomic_write(path, data):
+        """先写临时文件再替换目标文件，避免写入中断导致文件损坏"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def save_image(image, image_path):
+        """按扩展名对应的存储参数保存截图"""
+        ext = os.path.splitext(image_path)[1][1:].lower()
+        options = Config.IMAGE_SAVE_OPTIONS.get("jpg" if ext == "jpeg" else ext)
+        if options is None:
+            image.save(image_path)
+            return
+        if options["format"] == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(image_path, **options)
+
+    @staticmethod
+    def thumbnail_path(image_path):
+        """获取截图对应的缩略图路径"""
+        return f"{os.path.splitext(image_path)[0]}_thumb.{Config.THUMBNAIL_FORMAT[0]}"
+
+    @staticmethod
+    def needs_thumbnail(size):
+        """截图超过缩略图尺寸时才需要生成缩略图"""
+        return max(size) > Config.THUMBNAIL_SIZE
+
+    @staticmethod
+    def save_thumbnail(image, thumb_path):
+        """生成并保存缩略图，供报告嵌入使用"""
+        thumb = image.copy()
+        thumb.thumbnail((Config.THUMBNAIL_SIZE, Config.THUMBNAIL_SIZE), Image.Resampling.BILINEAR)
+        thumb_format = Config.THUMBNAIL_FORMAT[1]
+        if thumb_format == "JPEG" and thumb.mode != "RGB":
+            thumb = thumb.convert("RGB")
+        thumb.save(thumb_path, thumb_format, quality=Config.THUMBNAIL_QUALITY)
+
+    @staticmethod
+    def get_image_size(image_path):
+        """获取图片尺寸，PNG直接读取IHDR文件头，无需解码像素"""
+        with open(image_path, "rb") as f:
+            header = f.read(24)
+        if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR":
+            return struct.unpack(">II", header[16:24])
+        with Image.open(image_path) as img:
+            return img.size
+
+    @staticmethod
+    def get_capture_size(capture):
+        """获取截图尺寸，优先使用截图时记录的宽高，旧会话回退到读取文件头"""
+        if "width" in capture and "height" in capture:
+            return capture["width"], capture["height"]
+        return Utils.get_image_size(capture["image_path"])
+
+    @staticmethod
+    def preview_size(image_size, screen_size):
+        """计算截图在全屏预览中的缩放比例和显示尺寸（只缩小不放大），返回 (比例, (宽, 高))"""
+        img_width, img_height = image_size
+        scale = min(screen_size[0] / img_width, screen_size[1] / img_height, 1.0)
+        return scale, (int(img_width * scale), int(img_height * scale))
+
+    @staticmethod
+    def existing_files(paths):
+        """批量检查文件是否存在：每个目录只扫描一次，返回 {存在的路径: 目录项}，回退逐个检查时目录项为None"""
+        paths_by_dir = {}
+        for path in paths:
+            paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+        existing = {}
+        for directory, dir_paths in paths_by_dir.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    found = {entry.name: entry for entry in entries}
+                existing.update((path, found[os.path.basename(path)])
+                                for path in dir_paths if os.path.basename(path) in found)
+            except OSError:
+                existing.update((path, None) for path in dir_paths if os.path.exists(path))
+        return existing
+
+    @staticmethod
+    def map_parallel(func, items):
+        """在线程池中并发执行，按顺序返回结果；执行失败时结果为异常对象"""
+        def run(item):
+            try:
+                return func(*item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=Config.REPORT_IMAGE_WORKERS) as executor:
+            return list(executor.map(run, items))
+
+    @staticmethod
+    def prepare_report_images(captures, prepare):
+        """并发处理报告截图，按顺序返回结果；原图不存在时为None，处理失败时为异常对象
+        prepare(capture, image_path, mtime_ns) 中的 image_path 有缩略图时为缩略图，否则为原图"""
+        existing = Utils.existing_files(
+            [capture["image_path"] for capture in captures] +
+            [capture["thumb_path"] for capture in captures if capture.get("thumb_path")]
+        )
+
+        def run(capture):
+            if capture["image_path"] not in existing:
+                return None
+            thumb_path = capture.get("thumb_path")
+            image_path = thumb_path if thumb_path in existing else capture["image_path"]
+            entry = existing[image_path]
+            # 每张截图只取一次修改时间；Windows上目录项自带stat信息，无需额外系统调用
+            mtime_ns = (entry.stat() if entry else os.stat(image_path)).st_mtime_ns
+            return prepare(capture, image_path, mtime_ns)
+
+        return Utils.map_parallel(run, [(capture,) for capture in captures])
+
+    @staticmethod
+    def json_loads(data):
+        """解析JSON字节串，优先使用orjson"""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode("utf-8"))
+
+    @staticmethod
+    def json_dumps(obj, indent=True):
+        """序列化为UTF-8编码的JSON字节串，indent为False时输出无空白的紧凑格式，优先使用orjson"""
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
     @staticmethod
     def get_font_with_chinese_support(size):
         """获取支持中文的字体，按优先级尝试"""
@@ -143,31 +335,64 @@ class Utils:
 
 # 报告生成器 - 按格式拆分，单一职责
 class DocxReportGenerator:
+    _template_bytes = None  # 空白文档模板的字节内容，首次生成报告时缓存
+
+    @staticmethod
+    def _new_document():
+        """基于缓存的空白模板创建新文档"""
+        from docx import Document
+        if DocxReportGenerator._template_bytes is None:
+            template = io.BytesIO()
+            Document().save(template)
+            DocxReportGenerator._template_bytes = template.getvalue()
+        return Document(io.BytesIO(DocxReportGenerator._template_bytes))
+
     @staticmethod
-    def generate(session, save_path):
-        doc = Document()
+    def _prepare_image(capture, image_path, mtime_ns):
+        """将截图缩放到显示尺寸并编码为JPEG，避免嵌入原图导致文档过大"""
+        picture = io.BytesIO()
+        with Image.open(image_path) as img:
+            size = (Config.DOCX_IMAGE_SIZE, Config.DOCX_IMAGE_SIZE)
+            img.thumbnail(size, Image.Resampling.BILINEAR)
+            img.convert("RGB").save(picture, "JPEG", quality=Config.DOCX_JPEG_QUALITY)
+        picture.seek(0)
+        return picture
+
+    @staticmethod
+    def generate(session, save_path, progress=None):
+        """生成Word报告，progress(当前步骤, 总步骤数)在生成线程中调用"""
+        # python-docx仅在生成报告时导入，加快程序启动
+        from docx.shared import Inches, Pt
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+        doc = DocxReportGenerator._new_document()
         # 报告标题
         doc.add_heading("操作记录报告", 0)
 
         # 基本信息
         doc.add_heading("一、基本信息", level=1)
-        info_table = doc.add_table(rows=5, cols=2)
-        info_table.cell(0, 0).text = "操作名称"
-        info_table.cell(0, 1).text = session["name"]
-        info_table.cell(1, 0).text = "操作描述"
-        info_table.cell(1, 1).text = session["description"]
-        info_table.cell(2, 0).text = "开始时间"
-        info_table.cell(2, 1).text = session["start_time"]
-        info_table.cell(3, 0).text = "结束时间"
-        info_table.cell(3, 1).text = session["end_time"]
-        info_table.cell(4, 0).text = "操作时长"
-        info_table.cell(4, 1).text = Utils.format_duration(session["duration"])
+        info_items = [
+            ("操作名称", session["name"]),
+            ("操作描述", session["description"]),
+            ("开始时间", session["start_time"]),
+            ("结束时间", session["end_time"]),
+            ("操作时长", Utils.format_duration(session["duration"]))
+        ]
+        info_table = doc.add_table(rows=len(info_items), cols=2)
+        # 逐行取单元格填充，避免每次cell()调用都重新遍历表格XML
+        for row, (label, value) in zip(info_table.rows, info_items):
+            label_cell, value_cell = row.cells
+            label_cell.text = label
+            value_cell.text = value
 
         # 操作步骤
         doc.add_heading("二、操作步骤", level=1)
         doc.add_paragraph(f"共 {len(session['captures'])} 步操作")
         doc.add_paragraph("")  # 空行分隔
 
+        # 解码缩放和JPEG编码并发完成，文档只在当前线程中按顺序组装
+        pictures = Utils.prepare_report_images(session["captures"], DocxReportGenerator._prepare_image)
+
         for i, capture in enumerate(session["captures"], 1):
             # 步骤标题
             step_title = doc.add_paragraph()
@@ -176,7 +401,7 @@ class DocxReportGenerator:
             step_title_run.font.size = Pt(11)
             step_title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-        for i, capture in enumerate(session["captures"], 1):
+        for i, (capture, picture) in enumerate(zip(session["captures"], pictures), 1):
             # 步骤标题
             step_title = doc.add_paragraph()
             step_title_run = step_title.add_run(f"步骤 {i}")
@@ -188,9 +413,11 @@ class DocxReportGenerator:
             doc.add_paragraph(capture["description"])
 
             try:
-                if os.path.exists(capture["image_path"]):
+                if isinstance(picture, Exception):
+                    raise picture
+                if picture is not None:
                     # 添加图片
-                    doc.add_picture(capture["image_path"], width=Inches(6))
+                    doc.add_picture(picture, width=Inches(6))
                     # 图片标题
                     caption = doc.add_paragraph()
                     caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -199,6 +426,9 @@ class DocxReportGenerator:
             except Exception as e:
                 doc.add_paragraph(f"[加载图片失败: {str(e)}]")
 
+            if progress:
+                progress(i, len(pictures))
+
             # 步骤分页
             # doc.add_page_break()
 
@@ -208,8 +438,9 @@ class DocxReportGenerator:
 
 class PdfReportGenerator:
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_available_font():
-        """获取可用的中文字体路径"""
+        """获取可用的中文字体路径（找到后缓存，未找到时下次重新搜索）"""
         font_candidates = []
         if sys.platform == "win32":
             font_candidates = [
@@ -239,19 +470,52 @@ class PdfReportGenerator:
         )
 
     @staticmethod
-    def generate(session, save_path):
-        font_path = PdfReportGenerator._get_available_font()
-        pdfmetrics.registerFont(TTFont('Chinese', font_path))
-        pdfmetrics.registerFontFamily('Chinese', normal='Chinese')
+    @functools.lru_cache(maxsize=Config.PDF_IMAGE_CACHE_SIZE)
+    def _encode_image(image_path, mtime_ns, new_width, new_height):
+        """缩放截图并编码为JPEG字节；以修改时间作为缓存键的一部分，文件变化后自动失效"""
+        with Image.open(image_path) as img:
+            # 按显示尺寸的2倍采样，兼顾清晰度与PDF体积
+            img.thumbnail((new_width * 2, new_height * 2), Image.Resampling.BILINEAR)
+            image_data = io.BytesIO()
+            img.convert("RGB").save(image_data, "JPEG", quality=Config.PDF_JPEG_QUALITY)
+        return image_data.getvalue()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=Config.PDF_IMAGE_CACHE_SIZE)
+    def _file_digest(image_path, mtime_ns):
+        """计算图片文件内容摘要，用于识别内容相同的截图"""
+        with open(image_path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+    @staticmethod
+    def _content_key(capture, image_path, mtime_ns):
+        """获取截图报告图片的内容摘要，连同图片路径和修改时间一起返回供编码使用"""
+        return PdfReportGenerator._file_digest(image_path, mtime_ns), image_path, mtime_ns
+
+    @staticmethod
+    def _prepare_image(capture, display_width, image_path, mtime_ns):
+        """缩放截图并编码为JPEG，返回 (JPEG字节, 显示宽度, 显示高度)"""
+        img_width, img_height = Utils.get_capture_size(capture)
+        scale = min(display_width / img_width, 1.0)
+        new_width = int(img_width * scale)
+        new_height = int(img_height * scale)
+        data = PdfReportGenerator._encode_image(image_path, mtime_ns, new_width, new_height)
+        return data, new_width, new_height
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _chinese_styles():
+        """注册中文字体并构建段落样式表，每个进程只执行一次；找不到字体时抛出异常，下次重试"""
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        # 解析TTF字体开销较大，与样式表一起缓存
+        if 'Chinese' not in pdfmetrics.getRegisteredFontNames():
+            font_path = PdfReportGenerator._get_available_font()
+            pdfmetrics.registerFont(TTFont('Chinese', font_path))
+            pdfmetrics.registerFontFamily('Chinese', normal='Chinese')
 
-        doc = SimpleDocTemplate(
-            save_path,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72
-        )
         styles = getSampleStyleSheet()
 
         # 自定义中文样式
@@ -293,6 +557,28 @@ class PdfReportGenerator:
             italic=True,
             alignment=1
         ))
+        return styles
+
+    @staticmethod
+    def generate(session, save_path, progress=None):
+        """生成PDF报告，progress(当前步骤, 总步骤数)在生成线程中调用"""
+        # reportlab仅在生成报告时导入，加快程序启动
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Image as RLImage, Spacer
+
+        # 中文字体与样式表每个进程只初始化一次
+        styles = PdfReportGenerator._chinese_styles()
+
+        # 先在内存中生成完整PDF，再一次性写入文件，失败时不会留下不完整的文件
+        pdf_buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            pdf_buffer,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
 
         # 构建内容
         elements = []
@@ -322,37 +608,129 @@ class PdfReportGenerator:
         elements.append(Paragraph(f"共 {len(session['captures'])} 步操作", styles['ChineseNormal']))
         elements.append(Spacer(1, 12))
 
-        for i, capture in enumerate(session["captures"], 1):
-            elements.append(Paragraph(f"步骤 {i}", styles['ChineseHeading2']))
-            elements.append(Paragraph(f"描述：{capture['description']}", styles['ChineseNormal']))
-            elements.append(Paragraph(f"截图时间：{capture['time']}", styles['ChineseNormal']))
-            elements.append(Spacer(1, 8))
+        # 循环中重复使用的样式和不变元素只创建一次
+        heading2_style = styles['ChineseHeading2']
+        normal_style = styles['ChineseNormal']
+        caption_style = styles['ChineseCaption']
+        step_spacer = Spacer(1, 8)
+        separator_spacer = Spacer(1, 24)
+        separator = Paragraph("-" * 60, normal_style)
+        capture_count = len(session["captures"])
+
+        # 内容相同的截图只缩放编码一次；reportlab按图像数据摘要命名图像对象，PDF中也只嵌入一份
+        content_keys = Utils.prepare_report_images(session["captures"], PdfReportGenerator._content_key)
+        unique_captures = {}
+        for capture, key in zip(session["captures"], content_keys):
+            if isinstance(key, tuple):
+                digest, image_path, mtime_ns = key
+                unique_captures.setdefault(digest, (capture, Config.PDF_IMAGE_WIDTH, image_path, mtime_ns))
+        # 解码缩放和JPEG编码并发完成，复用第一遍得到的路径和修改时间，不再重复检查文件
+        encoded = dict(zip(unique_captures, Utils.map_parallel(
+            PdfReportGenerator._prepare_image, list(unique_captures.values())
+        )))
+        prepared_images = [encoded[key[0]] if isinstance(key, tuple) else key for key in content_keys]
+        step_headings = {}  # 步骤标题对象id -> 步骤序号，用于报告进度
+
+        for i, (capture, prepared) in enumerate(zip(session["captures"], prepared_images), 1):
+            step_heading = Paragraph(f"步骤 {i}", heading2_style)
+            step_headings[id(step_heading)] = i
+            elements.append(step_heading)
+            elements.append(Paragraph(f"描述：{capture['description']}", normal_style))
+            elements.append(Paragraph(f"截图时间：{capture['time']}", normal_style))
+            elements.append(step_spacer)
 
             # 插入截图
             try:
-                if os.path.exists(capture["image_path"]):
-                    with Image.open(capture["image_path"]) as img:  # 使用with确保资源释放
-                        img_width, img_height = img.size
-                        scale = min(400 / img_width, 1.0)
-                        new_width = int(img_width * scale)
-                        new_height = int(img_height * scale)
-                        pdf_img = RLImage(capture["image_path"], width=new_width, height=new_height)
-                        elements.append(pdf_img)
-                        elements.append(Paragraph(f"图 {i}：步骤 {i} 截图", styles['ChineseCaption']))
+                if isinstance(prepared, Exception):
+                    raise prepared
+                if prepared is not None:
+                    # 嵌入预先缩放的JPEG，避免将全分辨率PNG写入PDF
+                    image_data, new_width, new_height = prepared
+                    pdf_img = RLImage(io.BytesIO(image_data), width=new_width, height=new_height)
+                    elements.append(pdf_img)
+                    elements.append(Paragraph(f"图 {i}：步骤 {i} 截图", caption_style))
                 else:
-                    elements.append(Paragraph(f"[截图文件不存在：{capture['image_path']}]", styles['ChineseNormal']))
+                    elements.append(Paragraph(f"[截图文件不存在：{capture['image_path']}]", normal_style))
             except Exception as e:
-                elements.append(Paragraph(f"[截图加载失败：{str(e)}]", styles['ChineseNormal']))
-
-            if i != len(session["captures"]):
-                elements.append(Spacer(1, 24))
-                elements.append(Paragraph("-" * 60, styles['ChineseNormal']))
-                elements.append(Spacer(1, 24))
-
+                elements.append(Paragraph(f"[截图加载失败：{str(e)}]", normal_style))
+
+            if i != capture_count:
+                elements.append(separator_spacer)
+                elements.append(separator)
+                elements.append(separator_spacer)
+
+        # 图片绘制到页面后即释放其解码后的像素数据，峰值内存不随截图数量增长
+        # 同时在绘制到步骤标题时报告进度
+        def on_flowable_drawn(flowable):
+            if isinstance(flowable, RLImage):
+                flowable.__dict__.pop("_img", None)
+            elif progress and id(flowable) in step_headings:
+                progress(step_headings[id(flowable)], capture_count)
+
+        doc.afterFlowable = on_flowable_drawn
         doc.build(elements)
+        Utils.atomic_write(save_path, pdf_buffer.getvalue())
 
 
 class MdReportGenerator:
+    # 报告头部与步骤模板，头部每份报告只格式化一次
+    HEADER_TEMPLATE = (
+        "# 操作记录报告\n"
+        "**报告生成时间**：{now}\n\n"
+        "## 一、操作基本信息\n"
+        "- **操作名称**：{name}\n"
+        "- **操作描述**：{description}\n"
+        "- **开始时间**：{start_time}\n"
+        "- **结束时间**：{end_time}\n"
+        "- **操作时长**：{duration}\n\n"
+        "## 二、详细操作步骤\n"
+        "共 {count} 步操作\n"
+    )
+    STEP_TEMPLATE = (
+        "### 步骤 {index}\n"
+        "- **描述**：{description}\n"
+        "- **截图时间**：{time}\n"
+        "{image}\n"
+    )
+
+    @staticmethod
+    def _image_markdown(index, capture, img_target_dir, img_rel_dir, use_relative, existing):
+        """生成单个步骤的截图引用，返回 (引用文本, 待复制的(源路径, 目标路径)或None)"""
+        try:
+            if capture["image_path"] not in existing:
+                return f"[截图文件不存在：{capture['image_path']}]", None
+            copy_pair = None
+            if use_relative:
+                # 复制图片到相对路径目录
+                img_filename = os.path.basename(capture["image_path"])
+                target_path = os.path.join(img_target_dir, img_filename)
+
+                # 仅在文件不存在时复制，复制统一在_copy_images中批量执行
+                if target_path not in existing:
+                    copy_pair = (capture["image_path"], target_path)
+                img_path = f"{img_rel_dir}/{img_filename}"
+            else:
+                img_path = capture["image_path"]
+            return f"![图 {index}：步骤 {index} 截图]({img_path})", copy_pair
+        except Exception as e:
+            return f"[截图加载失败：{str(e)}]", None
+
+    @staticmethod
+    def _copy_images(copy_pairs):
+        """并发复制图片（直接复制字节，无需解码再编码），返回 {目标路径: 错误信息}"""
+        def copy_one(pair):
+            try:
+                shutil.copyfile(*pair)
+                return None
+            except Exception as e:
+                return str(e)
+
+        if not copy_pairs:
+            return {}
+        with ThreadPoolExecutor(max_workers=Config.COPY_WORKERS) as executor:
+            errors = list(executor.map(copy_one, copy_pairs))
+        return {target: error for (_, target), error in zip(copy_pairs, errors) if error is not None}
+
     @staticmethod
     def generate(session, save_path, use_relative=False):
         """生成Markdown格式报告"""
@@ -360,56 +738,54 @@ class MdReportGenerator:
         img_rel_dir = "images"
         img_target_dir = os.path.join(report_dir, img_rel_dir)
 
-        # 如果使用相对路径，复制图片到目标目录
-        if use_relative and not Utils.ensure_dir(img_target_dir):
-            use_relative = False  # 目录创建失败则使用绝对路径
+        # 如果使用相对路径，复制图片到目标目录（可能在后台线程执行，不弹窗）
+        if use_relative:
+            try:
+                os.makedirs(img_target_dir, exist_ok=True)
+            except OSError:
+                use_relative = False  # 目录创建失败则使用绝对路径
 
         # 构建Markdown内容
-        md_content = []
-        md_content.append(f"# 操作记录报告")
-        md_content.append(f"**报告生成时间**：{Utils.get_timestamp()}\n")
-
-        # 基本信息
-        md_content.append("## 一、操作基本信息")
-        md_content.append(f"- **操作名称**：{session['name']}")
-        md_content.append(f"- **操作描述**：{session['description'] or '无'}")
-        md_content.append(f"- **开始时间**：{session['start_time']}")
-        md_content.append(f"- **结束时间**：{session['end_time']}")
-        md_content.append(f"- **操作时长**：{Utils.format_duration(session['duration'])}\n")
-
-        # 操作步骤
-        md_content.append("## 二、详细操作步骤")
-        md_content.append(f"共 {len(session['captures'])} 步操作\n")
-
-        for i, capture in enumerate(session["captures"], 1):
-            md_content.append(f"### 步骤 {i}")
-            md_content.append(f"- **描述**：{capture['description']}")
-            md_content.append(f"- **截图时间**：{capture['time']}")
-
-            try:
-                if os.path.exists(capture["image_path"]):
-                    if use_relative:
-                        # 复制图片到相对路径目录
-                        img_filename = os.path.basename(capture["image_path"])
-                        target_path = os.path.join(img_target_dir, img_filename)
-
-                        # 仅在文件不存在时复制
-                        if not os.path.exists(target_path):
-                            with Image.open(capture["image_path"]) as img:
-                                img.save(target_path)
-                        img_path = f"{img_rel_dir}/{img_filename}"
-                    else:
-                        img_path = capture["image_path"]
+        header = MdReportGenerator.HEADER_TEMPLATE.format_map({
+            "now": Utils.get_timestamp(),
+            "name": session["name"],
+            "description": session["description"] or "无",
+            "start_time": session["start_time"],
+            "end_time": session["end_time"],
+            "duration": Utils.format_duration(session["duration"]),
+            "count": len(session["captures"])
+        })
+        # 源图片和已复制的目标图片一次性检查是否存在
+        existing = Utils.existing_files(
+            [capture["image_path"] for capture in session["captures"]] +
+            ([os.path.join(img_target_dir, os.path.basename(capture["image_path"]))
+              for capture in session["captures"]] if use_relative else [])
+        )
+        images = [
+            MdReportGenerator._image_markdown(i, capture, img_target_dir, img_rel_dir, use_relative, existing)
+            for i, capture in enumerate(session["captures"], 1)
+        ]
 
-                    md_content.append(f"![图 {i}：步骤 {i} 截图]({img_path})\n")
-                else:
-                    md_content.append(f"[截图文件不存在：{capture['image_path']}]\n")
-            except Exception as e:
-                md_content.append(f"[截图加载失败：{str(e)}]\n")
+        # 同一目标文件只复制一次
+        copy_pairs = list({pair[1]: pair for _, pair in images if pair}.values())
+        copy_errors = MdReportGenerator._copy_images(copy_pairs)
+
+        # 步骤逐条生成并写入，不在内存中拼接整份报告
+        steps = (
+            MdReportGenerator.STEP_TEMPLATE.format_map({
+                "index": i,
+                "description": capture["description"],
+                "time": capture["time"],
+                "image": f"[截图加载失败：{copy_errors[pair[1]]}]"
+                if pair and pair[1] in copy_errors else image
+            })
+            for i, (capture, (image, pair)) in enumerate(zip(session["captures"], images), 1)
+        )
 
         # 写入文件
-        with open(save_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(md_content))
+        with open(save_path, "w", encoding="utf-8", buffering=Config.MD_WRITE_BUFFER) as f:
+            f.write(header)
+            f.writelines("\n" + step for step in steps)
 
 
 class ScreenCaptureTool:
@@ -422,16 +798,43 @@ class ScreenCaptureTool:
         # 数据存储
         self.current_session_id = None
         self.current_session = self._init_empty_session()
-        self.history_sessions = []
+        self.history_sessions = []  # 历史会话摘要列表（来自索引，不含截图明细）
         self.sessions_dir = Config.SESSIONS_DIR
+        self.index_path = os.path.join(self.sessions_dir, Config.INDEX_FILENAME)
+        self.sessions_index = {}  # 会话ID -> 会话摘要
+        self._history_rows = {}  # 会话ID -> 历史列表中当前显示的行数据
+        self._history_order = []  # 历史列表中当前的会话ID顺序
+        self._history_limit = Config.HISTORY_PAGE_SIZE  # 历史列表当前渲染的最大行数
+        self._session_hashes = {}  # 会话ID -> 最近一次写入内容的摘要
+        self._open_editors = {}  # 会话ID -> (编辑窗口, 编辑中的会话数据, 名称输入变量)，同一会话只保留一份数据
+        # 报告在后台线程中逐个生成，避免阻塞界面；reportlab的字体注册等全局状态不支持并发
+        self._report_executor = ThreadPoolExecutor(max_workers=1)
 
         # 状态变量
         self.is_capturing = False
         self.hotkey = Config.DEFAULT_HOTKEY
+        self.image_format = Config.DEFAULT_IMAGE_FORMAT
         self.hotkey_obj = None
+        self._hotkey_stop = None  # Windows下快捷键轮询线程的停止标志
+        self._capture_lock = threading.Lock()  # 截图流程（含预览窗口）进行中时持有
+        self._capture_pending = False  # 已有截图请求投递到界面队列、尚未执行
+        self._last_capture_ts = 0.0  # 上一次截图流程结束的时间
+        self._sct = None  # mss截图对象，首次截图时在界面线程中创建
         self.start_time = 0
         self.images_dir = ""
 
+        # 截图在后台线程中编码保存，避免阻塞快捷键回调
+        self._save_queue = None
+        self._save_errors = []
+
+        # 快捷键和后台线程不直接操作界面，而是投递到此队列由界面线程执行
+        self._ui_queue = queue.Queue()
+
+        # 临时提示窗口只创建一次，之后显示/隐藏复用
+        self._tip_window = None
+        self._tip_label = None
+        self._tip_after_id = None
+
         # 初始化字体
         self._init_fonts()
 
@@ -450,6 +853,24 @@ class ScreenCaptureTool:
         # 创建界面
         self.create_main_interface()
 
+        self._create_tip_window()
+
+        # 开始处理后台线程投递的界面操作
+        self.root.after(Config.UI_QUEUE_INTERVAL, self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """在界面线程中执行其他线程投递的操作"""
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                print(f"界面操作执行失败: {str(e)}")
+        self.root.after(Config.UI_QUEUE_INTERVAL, self._drain_ui_queue)
+
     def _init_empty_session(self):
         """初始化空会话数据结构"""
         return {
@@ -520,10 +941,17 @@ class ScreenCaptureTool:
         self.history_tree.column("captures", width=80, anchor=tk.CENTER)
         self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # 滚动条
+        # 滚动条：滚动到底部时渲染下一页历史记录
         scrollbar = ttk.Scrollbar(history_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.history_tree.configure(yscrollcommand=scrollbar.set)
+
+        def on_history_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 1.0 and self._history_limit < len(self.history_sessions):
+                self._history_limit += Config.HISTORY_PAGE_SIZE
+                self.update_history_list()
+
+        self.history_tree.configure(yscrollcommand=on_history_scroll)
 
         # 历史记录右键菜单
         self.history_menu = tk.Menu(self.root, tearoff=0)
@@ -562,19 +990,30 @@ class ScreenCaptureTool:
             return
 
         session_id = self.history_tree.item(selected_item[0])["tags"][0]
-        for session in self.history_sessions:
-            if session["id"] == session_id:
-                new_name = simpledialog.askstring(
-                    "重命名",
-                    "请输入新操作名称：",
-                    initialvalue=session["name"]
-                )
-                if new_name and new_name.strip():
-                    session["name"] = new_name.strip()
-                    self.save_session(session)
-                    self.update_history_list()
-                    messagebox.showinfo("成功", "操作名称已更新")
-                break
+        summary = self.sessions_index.get(session_id)
+        if summary is None:
+            return
+
+        new_name = simpledialog.askstring(
+            "重命名",
+            "请输入新操作名称：",
+            initialvalue=summary["name"]
+        )
+        if new_name and new_name.strip():
+            editor = self._open_editors.get(session_id)
+            if editor is not None:
+                # 会话已在编辑窗口中打开时修改同一份数据，避免两边互相覆盖
+                editor_window, session, name_var = editor
+                name_var.set(new_name.strip())
+                editor_window.title(f"编辑操作记录 - {new_name.strip()}")
+            else:
+                session = self._load_full_session(session_id)
+                if session is None:
+                    return
+            session["name"] = new_name.strip()
+            self.save_session(session)
+            self.update_history_list()
+            messagebox.showinfo("成功", "操作名称已更新")
 
     def delete_session(self):
         """删除会话"""
@@ -584,49 +1023,50 @@ class ScreenCaptureTool:
             return
 
         session_id = self.history_tree.item(selected_item[0])["tags"][0]
-        for session in self.history_sessions:
-            if session["id"] == session_id:
-                if messagebox.askyesno(
-                        "确认删除",
-                        f"确定删除「{session['name']}」及所有截图？\n此操作不可恢复！"
-                ):
-                    self.delete_session_by_id(session_id)
-                break
+        summary = self.sessions_index.get(session_id)
+        if summary is None:
+            return
+
+        if messagebox.askyesno(
+                "确认删除",
+                f"确定删除「{summary['name']}」及所有截图？\n此操作不可恢复！"
+        ):
+            self.delete_session_by_id(session_id)
 
     def delete_session_by_id(self, session_id):
         """通过ID删除会话"""
-        # 查找会话
-        session_to_remove = None
-        for session in self.history_sessions:
-            if session["id"] == session_id:
-                session_to_remove = session
-                break
-
-        if not session_to_remove:
+        if session_id not in self.sessions_index:
             return
 
         # 删除JSON配置文件
         session_path = os.path.join(self.sessions_dir, f"{session_id}.json")
-        if os.path.exists(session_path):
-            try:
-                os.remove(session_path)
-            except Exception as e:
-                messagebox.showerror("错误", f"删除配置文件失败：{str(e)}")
-                return
+        try:
+            os.remove(session_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("错误", f"删除配置文件失败：{str(e)}")
+            return
+        self._session_hashes.pop(session_id, None)
+        self.remove_capture_journal(session_id)
 
         # 删除截图文件夹
         images_dir = os.path.join(self.sessions_dir, session_id)
-        if os.path.exists(images_dir):
-            try:
-                for img_file in os.listdir(images_dir):
-                    os.remove(os.path.join(images_dir, img_file))
-                os.rmdir(images_dir)
-            except Exception as e:
-                messagebox.showerror("错误", f"删除截图文件失败：{str(e)}")
-                return
+        try:
+            shutil.rmtree(images_dir)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("错误", f"删除截图文件失败：{str(e)}")
+            return
 
-        # 更新列表
-        self.history_sessions.remove(session_to_remove)
+        # 更新索引和列表
+        del self.sessions_index[session_id]
+        self._save_index()
+        editor = self._open_editors.pop(session_id, None)
+        if editor is not None:
+            editor[0].destroy()
+        self.history_sessions = [summary for summary in self.history_sessions if summary["id"] != session_id]
         self.update_history_list()
         messagebox.showinfo("成功", "历史记录已删除")
 
@@ -660,9 +1100,17 @@ class ScreenCaptureTool:
         if not Utils.ensure_dir(self.images_dir):
             return
 
-        # 注册快捷键
+        # 注册快捷键：Windows下轮询按键状态，其他平台使用keyboard全局钩子
+        vk_codes = Utils.hotkey_to_vk_codes(self.hotkey) if sys.platform == "win32" else None
         try:
-            self.hotkey_obj = keyboard.add_hotkey(self.hotkey, self.capture_screen)
+            if vk_codes:
+                self._hotkey_stop = threading.Event()
+                threading.Thread(
+                    target=self._hotkey_poll_loop, args=(vk_codes, self._hotkey_stop), daemon=True
+                ).start()
+            else:
+                # 回调运行在keyboard的线程中，截图交给界面线程执行
+                self.hotkey_obj = keyboard.add_hotkey(self.hotkey, self._request_capture)
         except PermissionError:
             messagebox.showerror(
                 "权限错误",
@@ -684,6 +1132,10 @@ class ScreenCaptureTool:
             foreground="#d32f2f"
         )
 
+        # 先写入会话基本信息，之后每次截图只追加到日志文件
+        self.save_current_session()
+        self._start_image_writer()
+
         # 最小化主窗口并提示
         self.root.iconify()
         messagebox.showinfo(
@@ -697,6 +1149,9 @@ class ScreenCaptureTool:
             return
 
         # 清理快捷键
+        if self._hotkey_stop:
+            self._hotkey_stop.set()
+            self._hotkey_stop = None
         if self.hotkey_obj:
             try:
                 keyboard.remove_hotkey(self.hotkey_obj)
@@ -706,6 +1161,7 @@ class ScreenCaptureTool:
 
         # 更新会话数据
         self.is_capturing = False
+        self._stop_image_writer()
         self.current_session["end_time"] = Utils.get_timestamp()
         self.current_session["duration"] = int(time.time() - self.start_time)
 
@@ -715,8 +1171,10 @@ class ScreenCaptureTool:
         self.root.title(f"{Config.APP_TITLE} - 就绪")
         self.status_label.config(text="状态：就绪", foreground="#666")
 
-        # 保存会话并刷新历史
-        self.save_current_session()
+        # 保存完整会话并移除截图日志，然后刷新历史
+        # 完整会话写入成功后才删除截图日志，否则日志是截图记录唯一的持久副本
+        if self.save_current_session():
+            self.remove_capture_journal(self.current_session_id)
         self.load_history_sessions()
         self.update_history_list()
 
@@ -726,8 +1184,40 @@ class ScreenCaptureTool:
         else:
             messagebox.showinfo("提示", "此次捕捉未生成任何截图，无需编辑")
 
+    def _hotkey_poll_loop(self, vk_codes, stop_event):
+        """轮询快捷键按下状态，按下瞬间请求截图"""
+        get_key_state = ctypes.windll.user32.GetAsyncKeyState
+        was_pressed = False
+        while not stop_event.is_set():
+            pressed = all(get_key_state(vk) & 0x8000 for vk in vk_codes)
+            if pressed and not was_pressed:
+                self._request_capture()
+            was_pressed = pressed
+            time.sleep(Config.HOTKEY_POLL_INTERVAL)
+
+    def _request_capture(self):
+        """快捷键线程调用：截图进行中或已有待执行的请求时丢弃本次按键，否则投递截图操作"""
+        if self._capture_pending or self._capture_lock.locked():
+            return
+        self._capture_pending = True
+        self._ui_queue.put(self.capture_screen)
+
     def capture_screen(self):
-        """捕捉屏幕截图"""
+        """捕捉屏幕截图，忽略上次截图结束后过短间隔内或正在截图时的触发"""
+        self._capture_pending = False
+        if time.monotonic() - self._last_capture_ts < Config.CAPTURE_DEBOUNCE:
+            return
+        if not self._capture_lock.acquire(blocking=False):
+            return
+        try:
+            self._capture_screen()
+        finally:
+            # 从截图流程结束（预览关闭）时开始计算间隔
+            self._last_capture_ts = time.monotonic()
+            self._capture_lock.release()
+
+    def _capture_screen(self):
+        """执行一次截图：抓屏、预览并加入当前会话"""
         if not self.is_capturing:
             return
 
@@ -737,7 +1227,7 @@ class ScreenCaptureTool:
                 os.makedirs(self.images_dir)
 
             # 捕获全屏截图
-            screenshot = ImageGrab.grab()
+            screenshot = self._grab_screen()
             original_size = screenshot.size
         except ImportError:
             messagebox.showerror(
@@ -763,42 +1253,92 @@ class ScreenCaptureTool:
         is_cropped = final_size != original_size
         print(f"原始图像大小: {original_size}, 保存图像大小: {final_size}, 是否已裁剪: {is_cropped}")
 
-        # 保存截图
-        capture_time = Utils.get_file_timestamp()
-        img_filename = f"capture_{capture_time}.png"
+        # 保存截图：交给后台线程编码写入，路径已确定，可立即记录到会话
+        # 文件名与记录时间取自同一时刻
+        now = datetime.datetime.now()
+        capture_time = Utils.get_file_timestamp(now)
+        img_filename = f"capture_{capture_time}.{self.image_format}"
         img_path = os.path.join(self.images_dir, img_filename)
-        try:
-            # 确保使用裁剪后的图像保存
-            final_image.save(img_path)
-            print(f"已保存图像到: {img_path}")
-
-            # 验证保存是否成功
-            if os.path.exists(img_path):
-                saved_img = Image.open(img_path)
-                saved_size = saved_img.size
-                print(f"保存的图像实际大小: {saved_size}")
-                saved_img.close()
-        except Exception as e:
-            messagebox.showerror("保存错误", f"截图保存失败：{str(e)}")
-            print(f"保存错误详情: {str(e)}")
+        save_queue = self._save_queue
+        if save_queue is None:
+            # 预览期间捕捉已停止
             return
+        thumb_path = Utils.thumbnail_path(img_path) if Utils.needs_thumbnail(final_size) else None
+        save_queue.put((final_image, img_path, thumb_path))
 
         # 添加到会话记录
         capture_count = len(self.current_session["captures"]) + 1
-        self.current_session["captures"].append({
+        capture = {
             "id": capture_count,
-            "time": Utils.get_timestamp(),
+            "time": Utils.get_timestamp(now),
             "description": description or f"第{capture_count}次记录",
-            "image_path": img_path
-        })
-
+            "image_path": img_path,
+            "width": final_size[0],
+            "height": final_size[1]
+        }
+        if thumb_path:
+            capture["thumb_path"] = thumb_path
+        self.current_session["captures"].append(capture)
+        if not self.append_capture(capture):
+            self.show_temp_tip(f"第{capture_count}次截图记录写入失败，停止捕捉时将重试保存")
         # 显示临时提示，包含是否裁剪的信息
-        if is_cropped:
+        elif is_cropped:
             self.show_temp_tip(f"已完成第{capture_count}次截图 (已裁剪)")
         else:
             self.show_temp_tip(f"已完成第{capture_count}次截图")
 
-    def show_capture_preview(self, screenshot, description=""):
+    def _grab_screen(self):
+        """抓取屏幕截图，安装了mss时优先使用，失败时回退到ImageGrab"""
+        if mss is not None:
+            try:
+                if self._sct is None:
+                    self._sct = mss.mss()
+                # 与ImageGrab.grab()的范围一致：Windows/macOS下为主显示器，Linux下为包含所有显示器的整个桌面
+                monitor = self._sct.monitors[1 if sys.platform in ("win32", "darwin") else 0]
+                raw = self._sct.grab(monitor)
+                return Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
+            except Exception as e:
+                print(f"mss截图失败，改用ImageGrab: {str(e)}")
+        return ImageGrab.grab()
+
+    def _start_image_writer(self):
+        """启动后台截图保存线程"""
+        self._save_queue = queue.Queue()
+        self._save_errors = []
+        threading.Thread(target=self._image_writer_loop, args=(self._save_queue,), daemon=True).start()
+
+    def _image_writer_loop(self, save_queue):
+        """后台保存截图，收到None时退出"""
+        while True:
+            item = save_queue.get()
+            try:
+                if item is None:
+                    return
+                image, img_path, thumb_path = item
+                Utils.save_image(image, img_path)
+                # 缩略图一次生成，之后的报告直接复用
+                if thumb_path:
+                    Utils.save_thumbnail(image, thumb_path)
+                print(f"已保存图像到: {img_path}")
+            except Exception as e:
+                filename = os.path.basename(img_path)
+                self._save_errors.append(f"{filename}：{str(e)}")
+                self._ui_queue.put(lambda name=filename: self.show_temp_tip(f"截图保存失败：{name}"))
+                print(f"保存错误详情: {str(e)}")
+            finally:
+                save_queue.task_done()
+
+    def _stop_image_writer(self):
+        """等待所有截图写入完成并停止后台线程"""
+        if self._save_queue is None:
+            return
+        self._save_queue.put(None)
+        self._save_queue.join()
+        self._save_queue = None
+        if self._save_errors:
+            messagebox.showerror("保存错误", "以下截图保存失败：\n" + "\n".join(self._save_errors))
+
+    def show_capture_preview(self, screenshot, description="", display_image=None):
         """显示截图预览窗口，支持区域选择、添加描述、自由标注和鼠标滚轮缩放功能"""
         # 创建全屏预览窗口
         preview_window = tk.Toplevel(self.root)
@@ -815,11 +1355,13 @@ class ScreenCaptureTool:
 
         # 调整图像大小以适应屏幕
         img_width, img_height = screenshot.size
-        scale = min(screen_width / img_width, screen_height / img_height, 1.0)
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
+        scale, (new_width, new_height) = Utils.preview_size(screenshot.size, (screen_width, screen_height))
 
-        resized_img = screenshot.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # 已预先缩放好的预览图尺寸一致时直接使用
+        if display_image is not None and display_image.size == (new_width, new_height):
+            resized_img = display_image
+        else:
+            resized_img = screenshot.resize((new_width, new_height), Image.Resampling.LANCZOS)
         photo = ImageTk.PhotoImage(resized_img)
 
         # 居中显示图像
@@ -1378,10 +1920,10 @@ class ScreenCaptureTool:
         """保存快捷键配置到文件"""
         try:
             config = {
-                "hotkey": self.hotkey
+                "hotkey": self.hotkey,
+                "image_format": self.image_format
             }
-            with open(Config.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            Utils.atomic_write(Config.CONFIG_FILE, Utils.json_dumps(config))
         except Exception as e:
             messagebox.showwarning("警告", f"保存快捷键配置失败：{str(e)}")
 
@@ -1393,6 +1935,8 @@ class ScreenCaptureTool:
                     config = json.load(f)
                     if "hotkey" in config:
                         self.hotkey = config["hotkey"]
+                    if config.get("image_format") in Config.IMAGE_SAVE_OPTIONS:
+                        self.image_format = config["image_format"]
         except Exception as e:
             messagebox.showwarning("警告", f"加载快捷键配置失败：{str(e)}")
             # 使用默认快捷键
@@ -1457,32 +2001,47 @@ class ScreenCaptureTool:
         ttk.Button(btn_frame, text="取消", command=hotkey_window.destroy).pack(side=tk.RIGHT, padx=10)
         ttk.Button(btn_frame, text="确认", command=confirm_hotkey).pack(side=tk.RIGHT, padx=10)
 
+    def _create_tip_window(self):
+        """创建隐藏的临时提示窗口"""
+        self._tip_window = tk.Toplevel(self.root)
+        self._tip_window.withdraw()
+        self._tip_window.overrideredirect(True)
+        self._tip_window.configure(bg="#2196f3")
+        self._tip_window.attributes("-topmost", True)
+        self._tip_label = ttk.Label(
+            self._tip_window,
+            background="#2196f3",
+            foreground="white",
+            padding=10
+        )
+        self._tip_label.pack(fill=tk.BOTH, expand=True)
+
     def show_temp_tip(self, message):
         """显示临时提示窗口"""
-        tip_window = tk.Toplevel(self.root)
-        tip_window.overrideredirect(True)
-
-        # 计算窗口位置（右下角）
+        # 新提示覆盖旧提示，取消尚未执行的隐藏
+        if self._tip_after_id:
+            self.root.after_cancel(self._tip_after_id)
+        self._tip_label.config(text=message)
+
+        # 按文本实际尺寸计算窗口位置（右下角）
+        self._tip_window.update_idletasks()
+        window_width = self._tip_label.winfo_reqwidth()
+        window_height = self._tip_label.winfo_reqheight()
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        window_width = len(message) * 10 + 40
-        window_height = 50
         x_pos = max(0, screen_width - window_width - 20)
         y_pos = max(0, screen_height - window_height - 40)
-        tip_window.geometry(f"{window_width}x{window_height}+{x_pos}+{y_pos}")
-        tip_window.configure(bg="#2196f3")
-        tip_window.attributes("-topmost", True)
+        self._tip_window.geometry(f"{window_width}x{window_height}+{x_pos}+{y_pos}")
+        self._tip_window.deiconify()
+        self._tip_window.lift()
 
-        ttk.Label(
-            tip_window,
-            text=message,
-            background="#2196f3",
-            foreground="white",
-            padding=10
-        ).pack(fill=tk.BOTH, expand=True)
+        # 自动隐藏
+        self._tip_after_id = self.root.after(Config.TEMP_TIP_DURATION, self._hide_temp_tip)
 
-        # 自动关闭
-        tip_window.after(Config.TEMP_TIP_DURATION, tip_window.destroy)
+    def _hide_temp_tip(self):
+        """隐藏临时提示窗口"""
+        self._tip_after_id = None
+        self._tip_window.withdraw()
 
     def open_editor_window(self, session):
         """打开会话编辑窗口"""
@@ -1505,6 +2064,15 @@ class ScreenCaptureTool:
         name_entry = ttk.Entry(info_frame, textvariable=name_var, width=60)
         name_entry.grid(row=0, column=1, sticky=tk.W, pady=3)
 
+        # 登记已打开的编辑窗口，窗口关闭时注销
+        self._open_editors[session["id"]] = (editor_window, session, name_var)
+
+        def unregister_editor(event):
+            if event.widget is editor_window and self._open_editors.get(session["id"], (None,))[0] is editor_window:
+                del self._open_editors[session["id"]]
+
+        editor_window.bind("<Destroy>", unregister_editor, add="+")
+
         # 描述输入
         ttk.Label(info_frame, text="操作描述：").grid(row=1, column=0, sticky=tk.NW, pady=3)
         desc_text = scrolledtext.ScrolledText(info_frame, width=60, height=4, wrap=tk.WORD)
@@ -1560,6 +2128,15 @@ class ScreenCaptureTool:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         captures_tree.configure(yscrollcommand=scrollbar.set)
 
+        # 截图ID -> 在列表中的位置，截图增删或重新编号后需重建
+        capture_index = {}
+
+        def rebuild_capture_index():
+            capture_index.clear()
+            capture_index.update((cap["id"], i) for i, cap in enumerate(session["captures"]))
+
+        rebuild_capture_index()
+
         # 加载截图数据
         for capture in session["captures"]:
             captures_tree.insert("", tk.END, values=(
@@ -1569,6 +2146,76 @@ class ScreenCaptureTool:
                 "编辑 | 删除"
             ), tags=(capture["id"],))
 
+        # 焦点行变化时在后台解码并缩放，双击预览时只需在界面线程中创建PhotoImage
+        # 缓存按最近使用顺序淘汰，总大小不超过 PREVIEW_CACHE_BYTES
+        preview_cache = collections.OrderedDict()  # 图片路径 -> (文件修改时间, 预览尺寸的图像, 字节数)
+        preview_cache_lock = threading.Lock()
+        preview_loading = set()  # 已提交、尚未完成预加载的图片路径
+        preview_target = [None]  # 最近一次获得焦点的图片路径，已不是焦点的排队任务直接跳过
+        # 单个线程依次预加载，避免同时解码多张原图
+        preview_executor = ThreadPoolExecutor(max_workers=1)
+
+        def stop_preloading(event):
+            if event.widget is editor_window:
+                preview_target[0] = None  # 排队中的任务随之跳过
+                preview_executor.shutdown(wait=False)
+
+        editor_window.bind("<Destroy>", stop_preloading, add="+")
+        screen_size = (editor_window.winfo_screenwidth(), editor_window.winfo_screenheight())
+
+        def drop_preview(path):
+            with preview_cache_lock:
+                preview_cache.pop(path, None)
+
+        def load_preview(path):
+            try:
+                if path != preview_target[0]:
+                    return
+                mtime_ns = os.stat(path).st_mtime_ns
+                with preview_cache_lock:
+                    cached = preview_cache.get(path)
+                    if cached and cached[0] == mtime_ns:
+                        preview_cache.move_to_end(path)
+                        return
+                with Image.open(path) as img:
+                    _, size = Utils.preview_size(img.size, screen_size)
+                    resized = img.resize(size, Image.Resampling.LANCZOS)
+                nbytes = size[0] * size[1] * len(resized.getbands())
+                with preview_cache_lock:
+                    preview_cache[path] = (mtime_ns, resized, nbytes)
+                    preview_cache.move_to_end(path)
+                    total = sum(entry[2] for entry in preview_cache.values())
+                    while total > Config.PREVIEW_CACHE_BYTES and len(preview_cache) > 1:
+                        total -= preview_cache.popitem(last=False)[1][2]
+            except Exception as e:
+                print(f"预加载预览图失败: {str(e)}")
+            finally:
+                with preview_cache_lock:
+                    preview_loading.discard(path)
+
+        def preload_focused(event):
+            # 多选时只预加载焦点行
+            row = captures_tree.focus()
+            if not row:
+                return
+            capture_idx = capture_index.get(int(captures_tree.item(row)["tags"][0]))
+            if capture_idx is None:
+                return
+            path = session["captures"][capture_idx]["image_path"]
+            preview_target[0] = path
+            with preview_cache_lock:
+                if path in preview_cache or path in preview_loading:
+                    return
+                preview_loading.add(path)
+            try:
+                preview_executor.submit(load_preview, path)
+            except RuntimeError:
+                # 编辑窗口已关闭
+                with preview_cache_lock:
+                    preview_loading.discard(path)
+
+        captures_tree.bind("<<TreeviewSelect>>", preload_focused)
+
         # 截图列表操作处理
         def handle_capture_operation(event):
             region = captures_tree.identify_region(event.x, event.y)
@@ -1581,15 +2228,10 @@ class ScreenCaptureTool:
                 return
 
             capture_id = int(captures_tree.item(row)["tags"][0])
-            capture_idx = None
-            target_capture = None
-            for i, cap in enumerate(session["captures"]):
-                if cap["id"] == capture_id:
-                    capture_idx = i
-                    target_capture = cap
-                    break
-            if not target_capture:
+            capture_idx = capture_index.get(capture_id)
+            if capture_idx is None:
                 return
+            target_capture = session["captures"][capture_idx]
 
             x, y, width, height = captures_tree.bbox(row, col)
             if event.x < x + width / 2:
@@ -1612,27 +2254,29 @@ class ScreenCaptureTool:
                 # 删除截图
                 if messagebox.askyesno("确认删除", f"确定删除第{capture_id}次截图？\n此操作不可恢复！"):
                     try:
-                        if os.path.exists(target_capture["image_path"]):
-                            os.remove(target_capture["image_path"])
+                        for path in (target_capture["image_path"], target_capture.get("thumb_path")):
+                            if path and os.path.exists(path):
+                                os.remove(path)
                     except Exception as e:
                         messagebox.showerror("错误", f"删除图片失败：{str(e)}")
                         return
 
+                    drop_preview(target_capture["image_path"])
                     del session["captures"][capture_idx]
-                    # 重新编号
-                    for i, cap in enumerate(session["captures"]):
-                        cap["id"] = i + 1
+                    captures_tree.delete(row)
 
-                    # 刷新表格
-                    for item in captures_tree.get_children():
-                        captures_tree.delete(item)
-                    for cap in session["captures"]:
-                        captures_tree.insert("", tk.END, values=(
+                    # 只重新编号并刷新被删除行之后的截图
+                    rows = captures_tree.get_children()
+                    for i in range(capture_idx, len(session["captures"])):
+                        cap = session["captures"][i]
+                        cap["id"] = i + 1
+                        captures_tree.item(rows[i], values=(
                             cap["id"],
                             cap["time"],
                             cap["description"],
                             "编辑 | 删除"
                         ), tags=(cap["id"],))
+                    rebuild_capture_index()
                     self.save_session(session)
 
         captures_tree.bind("<Button-1>", handle_capture_operation)
@@ -1645,28 +2289,32 @@ class ScreenCaptureTool:
 
             row = captures_tree.identify_row(event.y)
             capture_id = int(captures_tree.item(row)["tags"][0])
-            target_capture = None
-            for cap in session["captures"]:
-                if cap["id"] == capture_id:
-                    target_capture = cap
-                    break
+            capture_idx = capture_index.get(capture_id)
+            target_capture = session["captures"][capture_idx] if capture_idx is not None else None
             if not target_capture or not os.path.exists(target_capture["image_path"]):
                 messagebox.showwarning("提示", "截图文件已损坏或不存在")
                 return
 
             # 使用功能更完整的show_capture_preview替代简单预览
             try:
-                # 加载现有图片
+                # 加载现有图片，编辑始终基于原始分辨率
                 with Image.open(target_capture["image_path"]) as img:
                     # 复制图片以避免修改原始文件
                     screenshot = img.copy()
 
+                # 预加载的预览图仅在文件未被修改时使用
+                display_image = None
+                with preview_cache_lock:
+                    cached = preview_cache.get(target_capture["image_path"])
+                if cached and cached[0] == os.stat(target_capture["image_path"]).st_mtime_ns:
+                    display_image = cached[1]
+
                 # 显示完整预览窗口，并处理返回结果以保存标注
                 # 保存原始描述
                 original_description = target_capture["description"]
 
                 # 调用预览窗口并获取返回结果，传入原始描述
-                result = self.show_capture_preview(screenshot, original_description)
+                result = self.show_capture_preview(screenshot, original_description, display_image)
 
                 # 如果用户点击了保存，处理返回的图片和描述
                 if result:
@@ -1674,7 +2322,20 @@ class ScreenCaptureTool:
                     # 更新原始图片
                     try:
                         # 保存更新后的图片到原始路径
-                        updated_image.save(target_capture["image_path"])
+                        Utils.save_image(updated_image, target_capture["image_path"])
+                        drop_preview(target_capture["image_path"])
+                        target_capture["width"], target_capture["height"] = updated_image.size
+
+                        # 重新生成缩略图；裁剪后不再需要缩略图时删除旧文件
+                        # 旧缩略图按记录的路径删除，其格式可能与当前缩略图格式不同
+                        thumb_path = Utils.thumbnail_path(target_capture["image_path"])
+                        old_thumb_path = target_capture.pop("thumb_path", None)
+                        if Utils.needs_thumbnail(updated_image.size):
+                            Utils.save_thumbnail(updated_image, thumb_path)
+                            target_capture["thumb_path"] = thumb_path
+                        if old_thumb_path and old_thumb_path != target_capture.get("thumb_path") \
+                                and os.path.exists(old_thumb_path):
+                            os.remove(old_thumb_path)
                         print(f"已保存更新后的图片到: {target_capture['image_path']}")
 
                         # 如果描述有变化，更新描述
@@ -1682,14 +2343,12 @@ class ScreenCaptureTool:
                             target_capture["description"] = updated_description
 
                             # 更新界面显示
-                            for row_id in captures_tree.get_children():
-                                if int(captures_tree.item(row_id)["tags"][0]) == capture_id:
-                                    captures_tree.item(row_id, values=(
-                                        capture_id,
-                                        target_capture["time"],
-                                        updated_description,
-                                        "编辑 | 删除"
-                                    ))
+                            captures_tree.item(row, values=(
+                                capture_id,
+                                target_capture["time"],
+                                updated_description,
+                                "编辑 | 删除"
+                            ))
 
                         # 保存会话数据
                         self.save_session(session)
@@ -1764,34 +2423,64 @@ class ScreenCaptureTool:
                 progress_win.geometry("300x100")
                 progress_win.transient(editor_window)
                 progress_win.grab_set()
-                ttk.Label(
+                # 生成期间不允许手动关闭进度窗口
+                progress_win.protocol("WM_DELETE_WINDOW", lambda: None)
+                progress_label = ttk.Label(
                     progress_win,
                     text=f"正在生成{report_format.upper()}报告...",
                     font=(Config.FONT_FAMILIES[0], 12)
-                ).pack(expand=True)
-                progress_win.update()
+                )
+                progress_label.pack(expand=True)
+                # 生成线程只更新进度数值，界面在轮询时刷新
+                report_progress = {"step": 0, "total": 0}
 
-                try:
-                    # 根据格式生成报告
+                def on_progress(step, total):
+                    report_progress.update(step=step, total=total)
+
+                # 使用会话快照生成报告，避免生成过程中编辑窗口修改数据
+                report_session = copy.deepcopy(session)
+
+                def build_report():
+                    # 根据格式生成报告（后台线程中执行）
                     if report_format == "docx":
-                        DocxReportGenerator.generate(session, save_path)
+                        DocxReportGenerator.generate(report_session, save_path, on_progress)
                     elif report_format == "pdf":
-                        PdfReportGenerator.generate(session, save_path)
+                        PdfReportGenerator.generate(report_session, save_path, on_progress)
                     elif report_format == "md":
                         MdReportGenerator.generate(
-                            session,
+                            report_session,
                             save_path,
                             use_relative=True
                         )
 
+                future = self._report_executor.submit(build_report)
+
+                # 在主线程中轮询生成结果，界面操作只在Tk线程中进行；
+                # 轮询挂在主窗口上，编辑窗口被关闭时仍能报告结果
+                def check_report():
+                    window_open = progress_win.winfo_exists()
+                    if not future.done():
+                        if window_open and report_progress["total"]:
+                            progress_label.config(
+                                text=f"正在生成{report_format.upper()}报告（{report_progress['step']}/{report_progress['total']}）..."
+                            )
+                        self.root.after(Config.REPORT_POLL_INTERVAL, check_report)
+                        return
+
+                    if window_open:
+                        progress_win.destroy()
+                    try:
+                        future.result()
+                    except Exception as e:
+                        messagebox.showerror("生成失败", f"报告生成错误：{str(e)}")
+                        return
+
                     messagebox.showinfo("成功", f"{report_format.upper()}报告已生成：\n{save_path}")
 
                     if messagebox.askyesno("打开报告", "是否立即打开生成的报告？"):
                         os.startfile(save_path)
-                except Exception as e:
-                    messagebox.showerror("生成失败", f"报告生成错误：{str(e)}")
-                finally:
-                    progress_win.destroy()
+
+                check_report()
 
             ttk.Button(format_win, text="确认生成", command=confirm_generate).pack(pady=15)
 
@@ -1819,11 +2508,9 @@ class ScreenCaptureTool:
             # 获取选中的截图
             selected_captures = []
             for item in selected_items:
-                capture_id = int(captures_tree.item(item)["tags"][0])
-                for cap in session["captures"]:
-                    if cap["id"] == capture_id:
-                        selected_captures.append(cap)
-                        break
+                capture_idx = capture_index.get(int(captures_tree.item(item)["tags"][0]))
+                if capture_idx is not None:
+                    selected_captures.append(session["captures"][capture_idx])
 
             # 选择导出目录
             export_dir = filedialog.askdirectory(title="选择导出目录")
@@ -1843,9 +2530,8 @@ class ScreenCaptureTool:
                         # 目标路径
                         target_path = os.path.join(export_dir, filename)
 
-                        # 复制文件
-                        with Image.open(cap["image_path"]) as img:
-                            img.save(target_path)
+                        # 复制文件（直接复制字节，避免有损格式重新编码）
+                        shutil.copyfile(cap["image_path"], target_path)
 
                         success_count += 1
                     else:
@@ -1863,8 +2549,26 @@ class ScreenCaptureTool:
 
             messagebox.showinfo("导出结果", "\n".join(result_msg))
 
+        # 导出格式化的会话JSON，便于查看或调试
+        def export_session_json():
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".json",
+                filetypes=[("JSON 文件 (.json)", "*.json")],
+                initialfile=f"{session['name']}.json",
+                title="导出会话JSON"
+            )
+            if not save_path:
+                return
+            try:
+                Utils.atomic_write(save_path, Utils.json_dumps(session))
+            except Exception as e:
+                messagebox.showerror("导出失败", f"会话JSON导出失败：{str(e)}")
+                return
+            messagebox.showinfo("成功", f"会话JSON已导出：\n{save_path}")
+
         # 在按钮框架中添加导出按钮（放在生成报告按钮旁边）
         ttk.Button(btn_frame, text="导出选中截图", command=export_screenshots).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="导出会话JSON", command=export_session_json).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="作废此操作", command=discard_operation).pack(side=tk.LEFT, padx=5)
 
     def _show_image_preview(self, capture, capture_id):
@@ -1949,49 +2653,255 @@ class ScreenCaptureTool:
         return photo
 
     def save_current_session(self):
-        """保存当前会话"""
+        """保存当前会话，返回是否保存成功"""
         if self.current_session_id and self.current_session:
-            self.save_session(self.current_session)
+            return self.save_session(self.current_session)
+        return False
+
+    def _capture_journal_path(self, session_id):
+        """获取会话截图日志文件路径"""
+        return os.path.join(self.sessions_dir, f"{session_id}.jsonl")
+
+    def append_capture(self, capture):
+        """将单条截图记录追加到当前会话的日志文件，避免每次截图都重写完整会话；返回是否写入成功"""
+        try:
+            with open(self._capture_journal_path(self.current_session_id), "ab") as f:
+                f.write(Utils.json_dumps(capture, indent=False) + b"\n")
+            return True
+        except Exception as e:
+            # 该截图记录此时只在内存中，与图片保存失败一样在停止捕捉时汇总提示
+            self._save_errors.append(f"{os.path.basename(capture['image_path'])}：截图记录写入失败：{str(e)}")
+            print(f"追加截图记录失败: {str(e)}")
+            return False
+
+    def remove_capture_journal(self, session_id):
+        """会话完整保存后删除截图日志文件"""
+        try:
+            os.remove(self._capture_journal_path(session_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"删除截图日志失败: {str(e)}")
 
     def save_session(self, session):
-        """保存会话到文件"""
+        """保存会话到文件，内容与上次写入相同时跳过；返回文件中的内容是否已是最新"""
         session_path = os.path.join(self.sessions_dir, f"{session['id']}.json")
         try:
-            with open(session_path, "w", encoding="utf-8") as f:
-                json.dump(session, f, ensure_ascii=False, indent=2)
+            # 会话文件使用紧凑格式；需要阅读时可在编辑窗口中导出格式化的JSON
+            data = Utils.json_dumps(session, indent=False)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._session_hashes.get(session["id"]) == digest:
+                return True
+
+            Utils.atomic_write(session_path, data)
+            self._session_hashes[session["id"]] = digest
+            self._update_index(session, os.stat(session_path).st_mtime_ns)
+            return True
         except Exception as e:
             messagebox.showerror("保存错误", f"会话保存失败：{str(e)}")
+            return False
+
+    @staticmethod
+    def _session_summary(session, mtime_ns):
+        """生成历史列表所需的会话摘要，mtime_ns用于判断索引是否过期"""
+        return {
+            "id": session["id"],
+            "name": session["name"],
+            "start_time": session["start_time"],
+            "duration": session["duration"],
+            "captures_count": len(session["captures"]),
+            "mtime_ns": mtime_ns
+        }
+
+    def _update_index(self, session, mtime_ns):
+        """更新单个会话的索引摘要并写回索引文件"""
+        summary = self._session_summary(session, mtime_ns)
+        entry = self.sessions_index.get(session["id"])
+        if entry == summary:
+            return
+        if entry is None:
+            self.sessions_index[session["id"]] = summary
+        else:
+            entry.update(summary)  # 原地更新，历史列表引用的是同一个摘要对象
+        self._save_index()
+
+    def _read_index(self):
+        """读取索引文件，不存在或损坏时返回空索引（会从会话文件重建）；格式不完整的索引项被丢弃并重新解析"""
+        try:
+            with open(self.index_path, "rb") as f:
+                index = Utils.json_loads(f.read())
+        except Exception:
+            return {}
+        if not isinstance(index, dict):
+            return {}
+        return {
+            session_id: entry for session_id, entry in index.items()
+            if isinstance(entry, dict) and all(key in entry for key in Config.SESSION_SUMMARY_KEYS)
+            and entry["id"] == session_id
+        }
+
+    def _save_index(self):
+        """写入索引文件；索引只是缓存，写入失败不影响会话数据"""
+        try:
+            Utils.atomic_write(self.index_path, Utils.json_dumps(self.sessions_index, indent=False))
+        except Exception as e:
+            print(f"保存历史索引失败: {str(e)}")
+
+    def _load_full_session(self, session_id):
+        """按需读取完整会话数据，遗留的截图日志一并回放"""
+        session_path = os.path.join(self.sessions_dir, f"{session_id}.json")
+        journal_path = self._capture_journal_path(session_id)
+        session, error = self._load_session_file(
+            session_path, journal_path if os.path.exists(journal_path) else None
+        )
+        if error is not None:
+            messagebox.showerror("加载错误", f"会话加载失败：{error}")
+        return session
+
+    @staticmethod
+    def _load_session_file(session_path, journal_path=None):
+        """读取单个会话文件，并回放未完成会话的截图日志，返回 (会话数据, 错误信息)"""
+        try:
+            with open(session_path, "rb") as f:
+                data = f.read()
+            # 解析前先在原始字节中检查必要字段，明显损坏的文件无需完整解析
+            missing = [key for key in Config.SESSION_REQUIRED_KEYS if b'"%s"' % key.encode() not in data]
+            if missing:
+                return None, f"缺少必要字段：{', '.join(missing)}"
+            session = Utils.json_loads(data)
+            if not isinstance(session, dict) or not all(key in session for key in Config.SESSION_REQUIRED_KEYS):
+                return None, "会话文件格式无效"
+            if journal_path:
+                known_ids = {capture["id"] for capture in session["captures"]}
+                with open(journal_path, "rb") as f:
+                    for line_no, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        # 异常退出时最后一行可能只写了一半：跳过无法解析的行，保留其余截图记录
+                        try:
+                            capture = Utils.json_loads(line)
+                        except Exception as e:
+                            print(f"跳过截图日志中无法解析的行 {journal_path}:{line_no}: {str(e)}")
+                            continue
+                        if not isinstance(capture, dict) or "id" not in capture or "image_path" not in capture:
+                            print(f"跳过截图日志中无效的记录 {journal_path}:{line_no}")
+                            continue
+                        if capture["id"] not in known_ids:
+                            session["captures"].append(capture)
+                            known_ids.add(capture["id"])
+            return session, None
+        except Exception as e:
+            return None, str(e)
 
     def load_history_sessions(self):
-        """加载历史会话"""
+        """加载历史会话摘要：读取索引文件，只解析索引中缺失或已变化的会话文件"""
         self.history_sessions = []
         try:
-            for filename in os.listdir(self.sessions_dir):
-                if filename.endswith(".json"):
-                    session_id = filename[:-5]
-                    session_path = os.path.join(self.sessions_dir, filename)
-                    with open(session_path, "r", encoding="utf-8") as f:
-                        session = json.load(f)
-                        self.history_sessions.append(session)
-            # 按开始时间排序（最新的在前）
-            self.history_sessions.sort(key=lambda x: x["start_time"], reverse=True)
+            with os.scandir(self.sessions_dir) as entries:
+                session_files = {}  # 会话ID -> (文件路径, 修改时间)
+                journal_paths = {}  # 会话ID -> 截图日志路径
+                for entry in entries:
+                    if not entry.is_file() or entry.name == Config.INDEX_FILENAME:
+                        continue
+                    if entry.name.endswith(".json"):
+                        session_files[entry.name[:-5]] = (entry.path, entry.stat().st_mtime_ns)
+                    elif entry.name.endswith(".jsonl"):
+                        journal_paths[entry.name[:-6]] = entry.path
         except Exception as e:
             messagebox.showerror("加载错误", f"历史记录加载失败：{str(e)}")
+            return
+
+        index = self._read_index()
+        # 丢弃会话文件已不存在的索引项
+        self.sessions_index = {session_id: index[session_id] for session_id in session_files
+                               if session_id in index}
+        stale_ids = [
+            session_id for session_id, (_, mtime_ns) in session_files.items()
+            if session_id in journal_paths or index.get(session_id, {}).get("mtime_ns") != mtime_ns
+        ]
+        index_changed = len(self.sessions_index) != len(index) or bool(stale_ids)
+
+        # 读取会话文件以磁盘I/O为主，使用线程池并发读取；弹窗统一在主线程中处理
+        with ThreadPoolExecutor(max_workers=Config.LOAD_WORKERS) as executor:
+            results = list(executor.map(
+                self._load_session_file,
+                [session_files[session_id][0] for session_id in stale_ids],
+                [journal_paths.get(session_id) for session_id in stale_ids]
+            ))
+
+        load_errors = []
+        for session_id, (session, error) in zip(stale_ids, results):
+            if error is not None:
+                load_errors.append(f"{session_id}.json：{error}")
+                self.sessions_index.pop(session_id, None)
+                continue
+            if session_id in journal_paths:
+                # 程序异常退出遗留的截图日志：合并进完整会话文件后删除，写入失败时保留日志下次重试
+                if self.save_session(session):
+                    self.remove_capture_journal(session_id)
+                else:
+                    self.sessions_index[session_id] = self._session_summary(session, session_files[session_id][1])
+            else:
+                self.sessions_index[session_id] = self._session_summary(session, session_files[session_id][1])
+
+        if index_changed:
+            self._save_index()
+
+        # 按开始时间排序（最新的在前），缺少开始时间时使用扫描目录时得到的文件修改时间
+        self.history_sessions = sorted(
+            self.sessions_index.values(),
+            key=lambda x: x.get("start_time") or Utils.get_timestamp(
+                datetime.datetime.fromtimestamp(x.get("mtime_ns", 0) / 1e9)
+            ),
+            reverse=True
+        )
+
+        # 所有加载失败的文件汇总为一个提示，条目过多时只列出前面部分
+        if load_errors:
+            listed = load_errors[:Config.MAX_LISTED_ERRORS]
+            if len(load_errors) > len(listed):
+                listed.append(f"……其余 {len(load_errors) - len(listed)} 个未列出")
+            messagebox.showwarning(
+                "加载警告",
+                f"{len(load_errors)} 个会话文件加载失败：\n" + "\n".join(listed)
+            )
 
     def update_history_list(self):
-        """更新历史记录列表"""
-        # 清空现有项
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-
-        # 添加所有会话
-        for session in self.history_sessions:
-            self.history_tree.insert("", tk.END, values=(
+        """更新历史记录列表，只渲染前_history_limit条，并只对新增、删除或内容变化的行进行操作"""
+        visible_sessions = self.history_sessions[:self._history_limit]
+        new_order = [session["id"] for session in visible_sessions]
+        new_ids = set(new_order)
+
+        # 删除已不存在的会话行
+        removed = [session_id for session_id in self._history_rows if session_id not in new_ids]
+        if removed:
+            self.history_tree.delete(*removed)
+            for session_id in removed:
+                del self._history_rows[session_id]
+
+        # 已有行的相对顺序发生变化时，需要逐行移动到新位置
+        kept_order = [session_id for session_id in self._history_order if session_id in new_ids]
+        reorder = kept_order != [session_id for session_id in new_order if session_id in self._history_rows]
+
+        for index, session in enumerate(visible_sessions):
+            session_id = session["id"]
+            values = (
                 session["name"],
                 session["start_time"],
                 Utils.format_duration(session["duration"]),
-                len(session["captures"])
-            ), tags=(session["id"],))
+                session["captures_count"]
+            )
+            old_values = self._history_rows.get(session_id)
+            if old_values is None:
+                self.history_tree.insert("", index, iid=session_id, values=values, tags=(session_id,))
+            else:
+                if old_values != values:
+                    self.history_tree.item(session_id, values=values)
+                if reorder:
+                    self.history_tree.move(session_id, "", index)
+            self._history_rows[session_id] = values
+
+        self._history_order = new_order
 
     def open_session(self, event):
         """打开选中的会话"""
@@ -2000,10 +2910,16 @@ class ScreenCaptureTool:
             return
 
         session_id = self.history_tree.item(selected_item[0])["tags"][0]
-        for session in self.history_sessions:
-            if session["id"] == session_id:
-                self.open_editor_window(session)
-                break
+        editor = self._open_editors.get(session_id)
+        if editor is not None:
+            # 已打开的会话直接切换到其编辑窗口，不再加载第二份数据
+            editor[0].deiconify()
+            editor[0].lift()
+            editor[0].focus_force()
+            return
+        session = self._load_full_session(session_id)
+        if session is not None:
+            self.open_editor_window(session)
 
     def on_main_window_close(self):
         """主窗口关闭处理"""